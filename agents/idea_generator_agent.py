@@ -1,10 +1,78 @@
 # agents/idea_generator_agent.py
 import os
+import json
 import asyncio
-from typing import Dict, Any
+import functools
+from typing import Dict, Any, List, Optional, Tuple
+
+from openai import AsyncAzureOpenAI, AsyncOpenAI, AzureOpenAI, OpenAI
+from openai.types.chat import ChatCompletion, ChatCompletionMessageParam
+from utils.prompts import (
+    IDEA_GENERATOR_SYSTEM_PROMPT,
+    render_idea_user_prompt,
+)
+from utils.http import get_async_http_client, get_http_client, loop_local
+from utils.openai_parallel import run_many
+from utils.response_cache import ResponseCache, cache_enabled
+
+# Completion settings shared by every idea request
+_MAX_TOKENS = 800
+_TEMPERATURE = 0.9  # Higher temperature for more creativity
+
+
+@functools.lru_cache(maxsize=256)
+def _build_messages(prompt: str) -> Tuple[ChatCompletionMessageParam, ...]:
+    """Build the chat messages for a user prompt.
+
+    The instructions live in a fixed system message so every request shares
+    the same prefix; only the short user message changes between prompts.
+    """
+    return (
+        {"role": "system", "content": IDEA_GENERATOR_SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": render_idea_user_prompt(prompt),
+        },
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _get_openai_client(
+    api_type: str,
+    api_key: Optional[str],
+    api_base: Optional[str],
+    api_version: Optional[str],
+) -> OpenAI | AzureOpenAI:
+    """Return the sync OpenAI client for a configuration, creating it once."""
+    if api_type == "azure":
+        return AzureOpenAI(
+            api_key=api_key,
+            api_version=api_version,
+            azure_endpoint=str(api_base),
+            http_client=get_http_client("openai"),
+        )
+    return OpenAI(api_key=api_key, http_client=get_http_client("openai"))
+
+
+def _get_async_openai_client(
+    api_type: str,
+    api_key: Optional[str],
+    api_base: Optional[str],
+    api_version: Optional[str],
+) -> AsyncOpenAI | AsyncAzureOpenAI:
+    """Return the async OpenAI client for a configuration on the running loop."""
+
+    def create() -> AsyncOpenAI | AsyncAzureOpenAI:
+        if api_type == "azure":
+            return AsyncAzureOpenAI(
+                api_key=api_key,
+                api_version=api_version,
+                azure_endpoint=str(api_base),
+                http_client=get_async_http_client("openai"),
+            )
+        return AsyncOpenAI(api_key=api_key, http_client=get_async_http_client("openai"))
 
-from openai import AzureOpenAI, OpenAI
-from utils.prompts import IDEA_GENERATOR_PROMPT_TEMPLATE
+    return loop_local(("openai", api_type, api_key, api_base, api_version), create)
 
 
 class IdeaGeneratorAgent:
@@ -22,17 +90,137 @@ class IdeaGeneratorAgent:
         self.api_version = os.getenv("OPENAI_API_VERSION")
         self.deployment_name = os.getenv("OPENAI_DEPLOYMENT_NAME")
 
-        # Initialize the appropriate client
         if self.api_type.lower() == "azure":
             if not (self.api_base and self.api_version and self.deployment_name):
                 raise RuntimeError("Missing Azure OpenAI configuration in .env")
-            self.client = AzureOpenAI(
-                api_key=self.api_key,
-                api_version=self.api_version,
-                azure_endpoint=self.api_base,
-            )
+            self._model_name = str(self.deployment_name)
         else:
-            self.client = OpenAI(api_key=self.api_key)
+            self._model_name = self.model
+
+        # Clients are shared between agents with the same configuration
+        self._client_config = (
+            self.api_type.lower(),
+            self.api_key,
+            self.api_base,
+            self.api_version,
+        )
+        self.client = _get_openai_client(*self._client_config)
+
+        # Responses are sampled at a high temperature, so identical prompts
+        # only share a cached answer when explicitly enabled (IDEA_CACHE=1)
+        self.cache: Optional[ResponseCache] = (
+            ResponseCache() if cache_enabled() else None
+        )
+
+    @property
+    def async_client(self) -> AsyncOpenAI | AsyncAzureOpenAI:
+        """Async client bound to the running event loop (use from a coroutine)."""
+        return _get_async_openai_client(*self._client_config)
+
+    def _payload(
+        self, messages: Tuple[ChatCompletionMessageParam, ...]
+    ) -> Dict[str, Any]:
+        """Build the chat completion request for the given messages."""
+        return {
+            "model": self._model_name,
+            "messages": messages,
+            "max_tokens": _MAX_TOKENS,
+            "temperature": _TEMPERATURE,
+        }
+
+    def _cache_key(self, payload: Dict[str, Any]) -> Optional[str]:
+        """Build the response cache key for a request, or None without a cache."""
+        if self.cache is None:
+            return None
+        content = "\n".join(str(m.get("content")) for m in payload["messages"])
+        return ResponseCache.make_key(
+            payload["model"], payload["temperature"], payload["max_tokens"], content
+        )
+
+    def _cached_result(self, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the cached ideas for cache_key, if caching is enabled.
+
+        A failing cache backend counts as a miss, so an outage only costs the
+        cache hit and never the answer.
+        """
+        if self.cache is None or cache_key is None:
+            return None
+        try:
+            cached = self.cache.get(cache_key)
+        except Exception as e:
+            print(f"Response cache read failed: {e}")
+            return None
+        return {"ideas": cached} if cached else None
+
+    def _store_result(self, cache_key: Optional[str], ideas: str) -> None:
+        """Cache generated ideas, ignoring cache backend failures."""
+        if self.cache is None or cache_key is None or not ideas:
+            return
+        try:
+            self.cache.set(cache_key, ideas)
+        except Exception as e:
+            print(f"Response cache write failed: {e}")
+
+    def _make_result(
+        self, response: ChatCompletion, cache_key: Optional[str]
+    ) -> Dict[str, Any]:
+        """Extract the generated ideas from a completion and cache them."""
+        content = response.choices[0].message.content
+        ideas = content.strip() if content else ""
+        self._store_result(cache_key, ideas)
+
+        # Return the ideas in the expected format for LangGraph state
+        return {"ideas": ideas}
+
+    def _make_request(
+        self, messages: Tuple[ChatCompletionMessageParam, ...]
+    ) -> Dict[str, Any]:
+        """Request ideas for the given messages with the sync client."""
+        payload = self._payload(messages)
+        cache_key = self._cache_key(payload)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            response = self.client.chat.completions.create(**payload)
+            return self._make_result(response, cache_key)
+
+        except Exception as e:
+            print(f"Error generating ideas: {e}")
+            return {"ideas": f"Error generating ideas: {str(e)}"}
+
+    async def _fetch_ideas_async(
+        self,
+        messages: Tuple[ChatCompletionMessageParam, ...],
+        client: Optional[AsyncOpenAI | AsyncAzureOpenAI] = None,
+    ) -> Dict[str, Any]:
+        """Request ideas with the async client, letting API errors propagate.
+
+        Args:
+            messages: Chat messages to send
+            client: Client to use instead of the agent's async client
+        """
+        payload = self._payload(messages)
+        cache_key = self._cache_key(payload)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            return cached
+
+        client = client or self.async_client
+        response = await client.chat.completions.create(**payload)
+        return self._make_result(response, cache_key)
+
+    async def _make_request_async(
+        self, messages: Tuple[ChatCompletionMessageParam, ...]
+    ) -> Dict[str, Any]:
+        """Request ideas for the given messages with the async client."""
+        try:
+            return await self._fetch_ideas_async(messages)
+
+        except Exception as e:
+            print(f"Error generating ideas: {e}")
+            return {"ideas": f"Error generating ideas: {str(e)}"}
 
     def generate_idea_sync(self, prompt: str) -> Dict[str, Any]:
         """Generate creative story ideas from a user prompt (synchronous version).
@@ -43,76 +231,153 @@ class IdeaGeneratorAgent:
         Returns:
             Dictionary containing generated story ideas
         """
-        # Format the prompt using the template
-        formatted_prompt = IDEA_GENERATOR_PROMPT_TEMPLATE.format(user_input=prompt)
-
-        # Make the API call
-        try:
-            if self.api_type.lower() == "azure":
-                response = self.client.chat.completions.create(
-                    model=str(self.deployment_name),
-                    messages=[{"role": "user", "content": formatted_prompt}],
-                    max_tokens=800,
-                    temperature=0.9,  # Higher temperature for more creativity
-                )
-            else:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": formatted_prompt}],
-                    max_tokens=800,
-                    temperature=0.9,  # Higher temperature for more creativity
-                )
-
-            # Extract the generated ideas
-            content = response.choices[0].message.content
-            ideas = content.strip() if content else ""
-
-            # Return the ideas in the expected format for LangGraph state
-            return {"ideas": ideas}
-
-        except Exception as e:
-            print(f"Error generating ideas: {e}")
-            return {"ideas": f"Error generating ideas: {str(e)}"}
+        return self._make_request(_build_messages(prompt))
 
     async def generate_idea(self, prompt: str) -> Dict[str, Any]:
         """Generate creative story ideas from a user prompt.
 
+        Uses the async client so the event loop stays free while waiting on
+        the LLM round trip.
+
         Args:
             prompt: User input to inspire story ideas
 
         Returns:
             Dictionary containing generated story ideas
         """
-        # Format the prompt using the template
-        formatted_prompt = IDEA_GENERATOR_PROMPT_TEMPLATE.format(user_input=prompt)
+        return await self._make_request_async(_build_messages(prompt))
 
-        # Make the API call
-        try:
-            if self.api_type.lower() == "azure":
-                response = self.client.chat.completions.create(
-                    model=str(self.deployment_name),
-                    messages=[{"role": "user", "content": formatted_prompt}],
-                    max_tokens=800,
-                    temperature=0.9,  # Higher temperature for more creativity
-                )
-            else:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": formatted_prompt}],
-                    max_tokens=800,
-                    temperature=0.9,  # Higher temperature for more creativity
-                )
-
-            # Extract the generated ideas
-            content = response.choices[0].message.content
-            ideas = content.strip() if content else ""
-
-            # Return the ideas in the expected format for LangGraph state
-            return {"ideas": ideas}
+    async def generate_ideas_many(self, prompts: List[str]) -> List[Dict[str, Any]]:
+        """Generate ideas for several prompts concurrently.
 
-        except Exception as e:
-            print(f"Error generating ideas: {e}")
-            return {"ideas": f"Error generating ideas: {str(e)}"}
+        Requests run through a bounded, rate-limited executor tuned with the
+        IDEA_MAX_CONCURRENT, IDEA_TPM and IDEA_RPM environment variables, and
+        rate-limited calls are retried with exponential backoff.
+
+        Args:
+            prompts: User inputs to generate ideas for
+
+        Returns:
+            List of idea dictionaries in the same order as prompts
+        """
+        if not prompts:
+            return []
+
+        message_sets = [_build_messages(prompt) for prompt in prompts]
+        # Rough token estimate: ~4 characters per prompt token plus the reply
+        est_tokens = _MAX_TOKENS + max(
+            (sum(len(str(m.get("content"))) for m in messages) // 4)
+            for messages in message_sets
+        )
+
+        # run_many owns the retries, so each attempt passes its rate limiter
+        client = self.async_client.with_options(max_retries=0)
+        results = await run_many(
+            [
+                functools.partial(self._fetch_ideas_async, messages, client)
+                for messages in message_sets
+            ],
+            est_tokens=est_tokens,
+            max_concurrent=int(os.getenv("IDEA_MAX_CONCURRENT", "10")),
+            tpm=int(os.getenv("IDEA_TPM", "90000")),
+            rpm=int(os.getenv("IDEA_RPM", "3500")),
+        )
+
+        ideas = []
+        for result in results:
+            if isinstance(result, BaseException):
+                print(f"Error generating ideas: {result}")
+                result = {"ideas": f"Error generating ideas: {str(result)}"}
+            ideas.append(result)
+        return ideas
+
+    async def generate_ideas_batch(
+        self, prompts: List[str], poll_interval: float = 30.0
+    ) -> Dict[str, str]:
+        """Generate ideas for many prompts through the OpenAI Batch API.
+
+        Batch jobs are billed at half the regular price but may take up to
+        24 hours, so this is meant for offline bulk runs, not the
+        interactive workflow.
+
+        Args:
+            prompts: User inputs to generate ideas for
+            poll_interval: Seconds to wait between batch status checks
+
+        Returns:
+            Dictionary mapping each prompt to its generated ideas
+        """
+        unique_prompts = list(dict.fromkeys(prompts))
+        if not unique_prompts:
+            return {}
+
+        # One JSONL request line per prompt; custom_id maps results back
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": f"idea-{i}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._payload(_build_messages(prompt)),
+                }
+            )
+            for i, prompt in enumerate(unique_prompts)
+        ]
+        batch_input = await self.async_client.files.create(
+            file=("idea_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = await self.async_client.batches.create(
+            input_file_id=batch_input.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+        # Wait for the batch to reach a terminal state
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            batch = await self.async_client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(
+                f"Idea batch {batch.id} ended with status {batch.status}"
+            )
+
+        ideas = {
+            prompt: "Error generating ideas: no result returned"
+            for prompt in unique_prompts
+        }
+        # Successful requests land in the output file and failed ones in the
+        # error file; either may be missing when every request went one way
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            output = await self.async_client.files.content(file_id)
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                prompt = unique_prompts[int(record["custom_id"].split("-", 1)[1])]
+                response = record.get("response") or {}
+                body = response.get("body") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    error = record.get("error") or body.get("error")
+                    ideas[prompt] = f"Error generating ideas: {error}"
+                    continue
+                content = body["choices"][0]["message"]["content"]
+                ideas[prompt] = content.strip() if content else ""
+
+        return ideas
+
+
+@functools.lru_cache(maxsize=None)
+def get_idea_agent() -> IdeaGeneratorAgent:
+    """Return the shared IdeaGeneratorAgent, creating it on first use.
+
+    Reusing one agent keeps its OpenAI clients (and their connection pools)
+    alive across LangGraph steps instead of rebuilding them per call.
+    """
+    return IdeaGeneratorAgent()
 
 
 # Function to be used as a LangGraph node (synchronous version)
@@ -128,8 +393,8 @@ def ideaAgentNode(state: Dict[str, Any]) -> Dict[str, Any]:
     # Get the user prompt from state
     user_prompt = state.get("prompt", "")
 
-    # Initialize the agent
-    idea_agent = IdeaGeneratorAgent()
+    # Get the shared agent
+    idea_agent = get_idea_agent()
 
     # Generate ideas (synchronous)
     ideas_result = idea_agent.generate_idea_sync(user_prompt)
@@ -151,8 +416,8 @@ async def ideaAgentNodeAsync(state: Dict[str, Any]) -> Dict[str, Any]:
     # Get the user prompt from state
     user_prompt = state.get("prompt", "")
 
-    # Initialize the agent
-    idea_agent = IdeaGeneratorAgent()
+    # Get the shared agent
+    idea_agent = get_idea_agent()
 
     # Generate ideas
     ideas_result = await idea_agent.generate_idea(user_prompt)
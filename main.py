@@ -8,6 +8,7 @@ from openai import AzureOpenAI, OpenAI
 
 client: OpenAI | AzureOpenAI  # Accept both types for mypy
 from langgraph.graph import StateGraph, END
+from utils.http import get_http_client
 from utils.notion_client import NotionStoryManager
 from agents.idea_generator_agent import ideaAgentNode
 
@@ -41,9 +42,10 @@ if OPENAI_API_TYPE.lower() == "azure":
         api_key=OPENAI_API_KEY,
         api_version=OPENAI_API_VERSION,
         azure_endpoint=OPENAI_API_BASE,
+        http_client=get_http_client("openai"),
     )
 else:
-    client = OpenAI(api_key=OPENAI_API_KEY)
+    client = OpenAI(api_key=OPENAI_API_KEY, http_client=get_http_client("openai"))
 
 
 # ------------------------------------------------------------------
@@ -4,15 +4,68 @@ Provides functions to list, update, and delete story entries.
 """
 
 import os
-from typing import List, Dict, Any
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterator, List, Dict, Any, Optional
 from dotenv import load_dotenv
-from utils.notion_client import NotionStoryManager
+
+if TYPE_CHECKING:
+    from utils.notion_client import NotionStoryManager
+
+_RULE = "=" * 60 + "\n"
+
+# Largest page_size the Notion API accepts for a database query
+_MAX_PAGE_SIZE = 100
+
+# (property, property type) pairs matched by search_stories
+_SEARCH_PROPERTIES = (
+    ("Title", "title"),
+    ("Setting", "rich_text"),
+    ("Characters", "rich_text"),
+)
+
+# Shared fallback for missing nested properties (never mutated)
+_EMPTY: Dict[str, Any] = {}
+
+_notion_manager: Optional["NotionStoryManager"] = None
+
+
+def get_notion_manager() -> "NotionStoryManager":
+    """Return the shared NotionStoryManager, creating it on first use."""
+    global _notion_manager
+    if _notion_manager is None:
+        # Imported here so the menu starts without loading the Notion SDK
+        from utils.notion_client import NotionStoryManager
+
+        _notion_manager = NotionStoryManager()
+    return _notion_manager
+
+
+def _title(prop: Dict[str, Any], default: str = "Untitled") -> str:
+    """Return the text of a Notion title property, or "" if it is empty."""
+    items = prop.get("title")
+    if not items:
+        return ""
+    return (items[0].get("text") or _EMPTY).get("content", default)
+
+
+def _rich_text(prop: Dict[str, Any], default: str = "") -> str:
+    """Return the first text segment of a rich_text property or block."""
+    items = prop.get("rich_text")
+    if not items:
+        return default
+    return (items[0].get("text") or _EMPTY).get("content", default)
+
+
+def _select(prop: Dict[str, Any], default: str = "Unknown") -> str:
+    """Return the chosen option name of a Notion select property."""
+    return (prop.get("select") or _EMPTY).get("name", default)
 
 
 def list_stories(limit: int = 10) -> None:
     """List recent stories from Notion database."""
     try:
-        notion_manager = NotionStoryManager()
+        notion_manager = get_notion_manager()
         response = notion_manager.get_story_pages(limit=limit)
 
         pages = response.get("results", [])
@@ -21,32 +74,25 @@ def list_stories(limit: int = 10) -> None:
             print("No stories found in the database.")
             return
 
-        print(f"\n📚 Recent Stories (showing {len(pages)}):")
-        print("=" * 60)
+        # Build the whole listing first and emit it with a single write
+        lines = [f"\n📚 Recent Stories (showing {len(pages)}):\n", _RULE]
 
         for i, page in enumerate(pages, 1):
-            properties = page.get("properties", {})
-
-            # Get title
-            title_prop = properties.get("Title", {})
-            title = ""
-            if title_prop.get("title"):
-                title = (
-                    title_prop["title"][0].get("text", {}).get("content", "Untitled")
-                )
-
-            # Get status
-            status_prop = properties.get("Status", {})
-            status = status_prop.get("select", {}).get("name", "Unknown")
+            properties = page.get("properties") or _EMPTY
+            title = _title(properties.get("Title") or _EMPTY)
+            status = _select(properties.get("Status") or _EMPTY)
 
             # Get created time
             created_time = page.get("created_time", "Unknown")
 
-            print(f"{i}. {title}")
-            print(f"   Status: {status}")
-            print(f"   Created: {created_time}")
-            print(f"   ID: {page.get('id', 'Unknown')}")
-            print()
+            lines.append(
+                f"{i}. {title}\n"
+                f"   Status: {status}\n"
+                f"   Created: {created_time}\n"
+                f"   ID: {page.get('id', 'Unknown')}\n\n"
+            )
+
+        sys.stdout.write("".join(lines))
 
     except Exception as e:
         print(f"Error listing stories: {e}")
@@ -55,73 +101,45 @@ def list_stories(limit: int = 10) -> None:
 def view_story_details(page_id: str) -> None:
     """View detailed information about a specific story."""
     try:
-        notion_manager = NotionStoryManager()
-
-        # Get the page details
-        page_response = notion_manager.client.pages.retrieve(page_id)
-        # Handle async response
-        if hasattr(page_response, "__dict__"):
-            page = page_response.__dict__
-        elif isinstance(page_response, dict):
-            page = page_response
-        else:
-            page = {"properties": {}}
-        properties = page.get("properties", {})
+        notion_manager = get_notion_manager()
+
+        # Fetch the page details and its content blocks concurrently;
+        # the two requests are independent
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            page_future = executor.submit(notion_manager.get_story_page, page_id)
+            blocks_future = executor.submit(notion_manager.get_story_blocks, page_id)
+            page = page_future.result()
+            blocks = blocks_future.result()
+
+        properties = page.get("properties") or _EMPTY
 
         print(f"\n📖 Story Details:")
         print("=" * 60)
 
-        # Title
-        title_prop = properties.get("Title", {})
-        title = ""
-        if title_prop.get("title"):
-            title = title_prop["title"][0].get("text", {}).get("content", "Untitled")
-        print(f"Title: {title}")
-
-        # Status
-        status_prop = properties.get("Status", {})
-        status = status_prop.get("select", {}).get("name", "Unknown")
-        print(f"Status: {status}")
+        print(f"Title: {_title(properties.get('Title') or _EMPTY)}")
+        print(f"Status: {_select(properties.get('Status') or _EMPTY)}")
 
         # Story components
         for component in ["Setting", "Characters", "Conflict", "Resolution"]:
-            component_prop = properties.get(component, {})
-            content = ""
-            if component_prop.get("rich_text"):
-                content = (
-                    component_prop["rich_text"][0].get("text", {}).get("content", "")
-                )
-
+            content = _rich_text(properties.get(component) or _EMPTY)
             if content:
                 print(f"\n{component}:")
                 print(f"{content}")
 
-        # Get the full story content from blocks
-        blocks_response = notion_manager.client.blocks.children.list(page_id)
-        # Handle async response
-        if hasattr(blocks_response, "__dict__"):
-            blocks = blocks_response.__dict__
-        elif isinstance(blocks_response, dict):
-            blocks = blocks_response
-        else:
-            blocks = {"results": []}
+        # Print the full story content from blocks
         print(f"\nComplete Story:")
         print("-" * 40)
 
-        for block in blocks.get("results", []):
+        for block in blocks:
             if block.get("type") == "paragraph":
-                paragraph = block.get("paragraph", {})
-                if paragraph.get("rich_text"):
-                    text = paragraph["rich_text"][0].get("text", {}).get("content", "")
-                    if text:
-                        print(text)
+                text = _rich_text(block.get("paragraph") or _EMPTY)
+                if text:
+                    print(text)
             elif block.get("type") == "heading_1":
-                heading = block.get("heading_1", {})
-                if heading.get("rich_text"):
-                    text = heading["rich_text"][0].get("text", {}).get("content", "")
-                    if text:
-                        print(f"\n{text}")
-                        print("=" * len(text))
+                text = _rich_text(block.get("heading_1") or _EMPTY)
+                if text:
+                    print(f"\n{text}")
+                    print("=" * len(text))
 
     except Exception as e:
         print(f"Error viewing story details: {e}")
@@ -130,12 +148,10 @@ def view_story_details(page_id: str) -> None:
 def update_story_status(page_id: str, new_status: str) -> None:
     """Update the status of a story."""
     try:
-        notion_manager = NotionStoryManager()
+        notion_manager = get_notion_manager()
 
-        # Update the status
-        notion_manager.client.pages.update(
-            page_id=page_id, properties={"Status": {"select": {"name": new_status}}}
-        )
+        # Update the status; going through the manager refreshes cached listings
+        notion_manager.update_story_page(page_id, {"status": new_status})
 
         print(f"✅ Story status updated to '{new_status}'")
 
@@ -146,7 +162,7 @@ def update_story_status(page_id: str, new_status: str) -> None:
 def delete_story(page_id: str) -> None:
     """Delete (archive) a story from the database."""
     try:
-        notion_manager = NotionStoryManager()
+        notion_manager = get_notion_manager()
 
         # Archive the page
         notion_manager.delete_story_page(page_id)
@@ -157,60 +173,149 @@ def delete_story(page_id: str) -> None:
         print(f"Error deleting story: {e}")
 
 
+def _iter_search_results(
+    notion_manager: "NotionStoryManager", query: str, limit: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield batches of pages matching query, following Notion's pagination.
+
+    Notion returns at most 100 results per request, so larger limits are
+    served by following next_cursor until limit pages have been yielded.
+    """
+    if not notion_manager.database_id:
+        raise ValueError("Database ID is required")
+
+    # The filter is the same for every page request, so build it once
+    search_filter = {
+        "or": [
+            {"property": name, kind: {"contains": query}}
+            for name, kind in _SEARCH_PROPERTIES
+        ]
+    }
+
+    remaining = limit
+    cursor = None
+    while remaining > 0:
+        query_args: Dict[str, Any] = {
+            "filter": search_filter,
+            "page_size": min(_MAX_PAGE_SIZE, remaining),
+        }
+        if cursor:
+            query_args["start_cursor"] = cursor
+        response = notion_manager.query_story_pages(**query_args)
+
+        pages = response.get("results", [])[:remaining]
+        if pages:
+            yield pages
+        remaining -= len(pages)
+
+        cursor = response.get("next_cursor")
+        if not response.get("has_more") or not cursor:
+            return
+
+
 def search_stories(query: str, limit: int = 10) -> None:
     """Search for stories by title or content."""
     try:
-        notion_manager = NotionStoryManager()
-
-        # Query the database with a filter
-        if not notion_manager.database_id:
-            raise ValueError("Database ID is required")
-        response_raw = notion_manager.client.databases.query(
-            database_id=notion_manager.database_id,
-            filter={
-                "or": [
-                    {"property": "Title", "title": {"contains": query}},
-                    {"property": "Setting", "rich_text": {"contains": query}},
-                    {"property": "Characters", "rich_text": {"contains": query}},
-                ]
-            },
-            page_size=limit,
-        )
+        notion_manager = get_notion_manager()
+
+        # Render each batch of results as soon as Notion returns it
+        shown = 0
+        for pages in _iter_search_results(notion_manager, query, limit):
+            lines = []
+            if not shown:
+                lines += [f"\n🔍 Search Results for '{query}':\n", _RULE]
+
+            for page in pages:
+                shown += 1
+                properties = page.get("properties") or _EMPTY
+                title = _title(properties.get("Title") or _EMPTY)
+                lines.append(
+                    f"{shown}. {title}\n   ID: {page.get('id', 'Unknown')}\n\n"
+                )
+
+            sys.stdout.write("".join(lines))
+            sys.stdout.flush()
+
+        if not shown:
+            print(f"No stories found matching '{query}'")
+
+    except Exception as e:
+        print(f"Error searching stories: {e}")
+
+
+_MENU = """
+📚 Notion Story Manager
+==============================
+1. List recent stories
+2. View story details
+3. Update story status
+4. Delete story
+5. Search stories
+6. Exit
+"""
+
+
+def _list_stories_prompt() -> None:
+    """Ask how many stories to list and show them."""
+    limit = input("How many stories to show? (default: 10): ").strip()
+    list_stories(int(limit) if limit.isdigit() else 10)
+
+
+def _view_story_prompt() -> None:
+    """Ask for a page ID and show the story details."""
+    page_id = input("Enter story page ID: ").strip()
+    if page_id:
+        view_story_details(page_id)
+    else:
+        print("❌ Please provide a valid page ID")
 
-        # Handle async response
-        if hasattr(response_raw, "__dict__"):
-            response = response_raw.__dict__
-        elif isinstance(response_raw, dict):
-            response = response_raw
+
+def _update_status_prompt() -> None:
+    """Ask for a page ID and new status and apply it."""
+    page_id = input("Enter story page ID: ").strip()
+    if page_id:
+        print("Available statuses: Generated, Draft, Published")
+        new_status = input("Enter new status: ").strip()
+        if new_status:
+            update_story_status(page_id, new_status)
         else:
-            response = {"results": []}
+            print("❌ Please provide a valid status")
+    else:
+        print("❌ Please provide a valid page ID")
 
-        pages = response.get("results", [])
 
-        if not pages:
-            print(f"No stories found matching '{query}'")
-            return
+def _delete_story_prompt() -> None:
+    """Ask for a page ID and confirmation, then archive the story."""
+    page_id = input("Enter story page ID: ").strip()
+    if page_id:
+        confirm = (
+            input("Are you sure you want to delete this story? (y/N): ").strip().lower()
+        )
+        if confirm == "y":
+            delete_story(page_id)
+        else:
+            print("Deletion cancelled")
+    else:
+        print("❌ Please provide a valid page ID")
 
-        print(f"\n🔍 Search Results for '{query}' (showing {len(pages)}):")
-        print("=" * 60)
 
-        for i, page in enumerate(pages, 1):
-            properties = page.get("properties", {})
-
-            # Get title
-            title_prop = properties.get("Title", {})
-            title = ""
-            if title_prop.get("title"):
-                title = (
-                    title_prop["title"][0].get("text", {}).get("content", "Untitled")
-                )
+def _search_stories_prompt() -> None:
+    """Ask for a search query and result count and run the search."""
+    query = input("Enter search query: ").strip()
+    if query:
+        limit = input("How many results to show? (default: 10): ").strip()
+        search_stories(query, int(limit) if limit.isdigit() else 10)
+    else:
+        print("❌ Please provide a search query")
 
-            print(f"{i}. {title}")
-            print(f"   ID: {page.get('id', 'Unknown')}")
-            print()
 
-    except Exception as e:
-        print(f"Error searching stories: {e}")
+_MENU_ACTIONS: Dict[str, Callable[[], None]] = {
+    "1": _list_stories_prompt,
+    "2": _view_story_prompt,
+    "3": _update_status_prompt,
+    "4": _delete_story_prompt,
+    "5": _search_stories_prompt,
+}
 
 
 def main():
@@ -223,71 +328,20 @@ def main():
         return
 
     while True:
-        print("\n📚 Notion Story Manager")
-        print("=" * 30)
-        print("1. List recent stories")
-        print("2. View story details")
-        print("3. Update story status")
-        print("4. Delete story")
-        print("5. Search stories")
-        print("6. Exit")
+        sys.stdout.write(_MENU)
+        sys.stdout.flush()
 
         choice = input("\nEnter your choice (1-6): ").strip()
 
-        if choice == "1":
-            limit = input("How many stories to show? (default: 10): ").strip()
-            limit = int(limit) if limit.isdigit() else 10
-            list_stories(limit)
-
-        elif choice == "2":
-            page_id = input("Enter story page ID: ").strip()
-            if page_id:
-                view_story_details(page_id)
-            else:
-                print("❌ Please provide a valid page ID")
-
-        elif choice == "3":
-            page_id = input("Enter story page ID: ").strip()
-            if page_id:
-                print("Available statuses: Generated, Draft, Published")
-                new_status = input("Enter new status: ").strip()
-                if new_status:
-                    update_story_status(page_id, new_status)
-                else:
-                    print("❌ Please provide a valid status")
-            else:
-                print("❌ Please provide a valid page ID")
-
-        elif choice == "4":
-            page_id = input("Enter story page ID: ").strip()
-            if page_id:
-                confirm = (
-                    input("Are you sure you want to delete this story? (y/N): ")
-                    .strip()
-                    .lower()
-                )
-                if confirm == "y":
-                    delete_story(page_id)
-                else:
-                    print("Deletion cancelled")
-            else:
-                print("❌ Please provide a valid page ID")
-
-        elif choice == "5":
-            query = input("Enter search query: ").strip()
-            if query:
-                limit = input("How many results to show? (default: 10): ").strip()
-                limit = int(limit) if limit.isdigit() else 10
-                search_stories(query, limit)
-            else:
-                print("❌ Please provide a search query")
-
-        elif choice == "6":
+        if choice == "6":
             print("👋 Goodbye!")
             break
 
-        else:
+        action = _MENU_ACTIONS.get(choice)
+        if action is None:
             print("❌ Invalid choice. Please enter a number between 1-6.")
+        else:
+            action()
 
 
 if __name__ == "__main__":
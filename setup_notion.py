@@ -7,19 +7,14 @@ import os
 import requests
 from dotenv import load_dotenv
 
+_REQUIRED_ENV_VARS = ("NOTION_TOKEN", "NOTION_DATABASE_ID")
+
 
 def check_env_vars():
     """Check if required environment variables are set."""
     load_dotenv()
 
-    required_vars = ["NOTION_TOKEN", "NOTION_DATABASE_ID"]
-    missing_vars = []
-
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
-
-    return missing_vars
+    return [var for var in _REQUIRED_ENV_VARS if not os.environ.get(var)]
 
 
 def test_notion_connection():
@@ -0,0 +1,114 @@
+"""
+Shared HTTP connection pools for the OpenAI and Notion clients.
+Long-lived pools keep TLS connections warm and multiplex requests over HTTP/2.
+"""
+
+import asyncio
+import atexit
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+import httpx
+
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# Per-service overrides. Notion calls never exceed the 32-slot ceiling of the
+# adaptive limiter in utils.notion_client, so keep all of them alive.
+_SERVICE_LIMITS = {
+    "notion": httpx.Limits(max_connections=32, max_keepalive_connections=32),
+}
+
+T = TypeVar("T")
+
+_clients: Dict[str, httpx.Client] = {}
+# Async connections belong to the event loop that opened them, so async
+# clients are kept per loop: {loop: {key: client}}
+_loop_objects: Dict[asyncio.AbstractEventLoop, Dict[Hashable, Any]] = {}
+
+
+def get_http_client(name: str) -> httpx.Client:
+    """
+    Return the shared sync connection pool for a service.
+
+    Pools are kept per service because some SDKs (notion_client) set their
+    own base URL and headers on the client they are given.
+
+    Args:
+        name: Service the pool is used for, e.g. "openai" or "notion"
+
+    Returns:
+        Shared httpx client
+    """
+    client = _clients.get(name)
+    if client is None:
+        client = _clients[name] = httpx.Client(
+            http2=True, limits=_SERVICE_LIMITS.get(name, _LIMITS)
+        )
+    return client
+
+
+def loop_local(key: Hashable, factory: Callable[[], T]) -> T:
+    """
+    Return the object cached under key for the running event loop.
+
+    Objects cached for loops that have since closed are dropped.
+
+    Args:
+        key: Cache key, unique per kind of object
+        factory: Creates the object on first use in a loop
+
+    Returns:
+        Object bound to the running loop
+    """
+    loop = asyncio.get_running_loop()
+    objects = _loop_objects.get(loop)
+    if objects is None:
+        for closed in [other for other in _loop_objects if other.is_closed()]:
+            del _loop_objects[closed]
+        objects = _loop_objects[loop] = {}
+
+    if key not in objects:
+        objects[key] = factory()
+    return objects[key]
+
+
+def get_async_http_client(name: str) -> httpx.AsyncClient:
+    """
+    Return the async connection pool for a service on the running event loop.
+
+    Must be called from a coroutine.
+
+    Args:
+        name: Service the pool is used for, e.g. "openai" or "notion"
+
+    Returns:
+        Shared httpx async client
+    """
+    return loop_local(
+        ("httpx", name),
+        lambda: httpx.AsyncClient(
+            http2=True, limits=_SERVICE_LIMITS.get(name, _LIMITS)
+        ),
+    )
+
+
+def close_http_clients() -> None:
+    """Close every shared connection pool."""
+    for client in _clients.values():
+        client.close()
+    _clients.clear()
+
+    # Async pools can only be closed on their own loop, which has normally
+    # finished by now; their sockets are released when they are collected
+    for loop, objects in _loop_objects.items():
+        if loop.is_closed() or loop.is_running():
+            continue
+        for obj in objects.values():
+            if isinstance(obj, httpx.AsyncClient):
+                try:
+                    loop.run_until_complete(obj.aclose())
+                except RuntimeError:
+                    pass
+    _loop_objects.clear()
+
+
+atexit.register(close_http_clients)
@@ -4,14 +4,494 @@ Handles async/sync issues and proper type annotations.
 """
 
 import os
-from typing import Dict, Any, Optional, Union
-from notion_client import Client
-from notion_client.errors import APIResponseError
+import json
+import logging
+import time
+import hashlib
+import functools
+import asyncio
+import threading
+import contextlib
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+import httpx
+import orjson
+from cachetools import TTLCache
+from tenacity import (
+    RetryCallState,
+    before_sleep_log,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+from notion_client import AsyncClient, Client
+from notion_client.errors import (
+    APIResponseError,
+    HTTPResponseError,
+    RequestTimeoutError,
+    is_api_error_code,
+)
+
+from utils.http import get_async_http_client, get_http_client, loop_local
+
+logger = logging.getLogger(__name__)
+
+# (story_data key, database property) pairs stored as rich_text properties
+_RT_FIELDS = (
+    ("setting", "Setting"),
+    ("characters", "Characters"),
+    ("conflict", "Conflict"),
+    ("resolution", "Resolution"),
+)
+
+
+# Static blocks and property values shared by every page. The SDK only
+# serializes them, so they are passed by reference instead of rebuilt.
+_HEADING_IDEAS: Dict[str, Any] = {
+    "object": "block",
+    "type": "heading_1",
+    "heading_1": {
+        "rich_text": [{"type": "text", "text": {"content": "Generated Ideas"}}]
+    },
+}
+_HEADING_STORY: Dict[str, Any] = {
+    "object": "block",
+    "type": "heading_1",
+    "heading_1": {
+        "rich_text": [{"type": "text", "text": {"content": "Complete Story"}}]
+    },
+}
+_STATUS_GENERATED: Dict[str, Any] = {"select": {"name": "Generated"}}
+
+# Most blocks Notion accepts in a single pages.create or children.append call
+_MAX_BLOCKS = 100
+
+
+def _rt(content: str) -> Dict[str, Any]:
+    """Build a Notion rich_text property value holding a single text run."""
+    return {"rich_text": [{"text": {"content": content}}]}
+
+
+_ELLIPSIS = "..."
+
+
+def _truncate_text(text: str, max_length: int = 1900) -> str:
+    """
+    Truncate text to fit Notion's character limit with ellipsis.
+
+    Args:
+        text: Text to truncate
+        max_length: Maximum length (default 1900 to be safe)
+
+    Returns:
+        Truncated text
+    """
+    # Short text, the common case, skips the cache lookup and its hashing
+    if len(text) <= max_length:
+        return text
+    return _truncate_long(text, max_length)
+
+
+@functools.lru_cache(maxsize=4096)
+def _truncate_long(text: str, max_length: int) -> str:
+    """Cut text that is over the limit and mark the cut with an ellipsis."""
+    return text[: max_length - len(_ELLIPSIS)] + _ELLIPSIS
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _parse_response(response: httpx.Response) -> Dict[str, Any]:
+    """
+    Decode a Notion response with orjson, raising the SDK's error types.
+
+    Args:
+        response: Response to a request sent outside the SDK
+
+    Returns:
+        Decoded response body
+    """
+    if response.is_error:
+        try:
+            body = orjson.loads(response.content)
+            code = body.get("code")
+        except (orjson.JSONDecodeError, AttributeError):
+            code = None
+        if code and is_api_error_code(code):
+            raise APIResponseError(response, body["message"], code)
+        raise HTTPResponseError(response)
+    return orjson.loads(response.content)
+
+
+def _split_text(text: str, max_length: int = 1900) -> List[str]:
+    """
+    Split text into paragraphs that each fit Notion's character limit.
+
+    Args:
+        text: Text to split; blank lines separate paragraphs
+        max_length: Maximum length of each piece
+
+    Returns:
+        Text pieces in order, at least one
+    """
+    pieces = []
+    for paragraph in text.split("\n\n"):
+        for start in range(0, len(paragraph), max_length):
+            pieces.append(paragraph[start : start + max_length])
+    return pieces or [""]
+
+
+def _paragraph(content: str) -> Dict[str, Any]:
+    """Build a paragraph block holding a single text run."""
+    return {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {"rich_text": [{"type": "text", "text": {"content": content}}]},
+    }
+
+
+def _chunks(items: List[Any], size: int = _MAX_BLOCKS) -> Iterator[List[Any]]:
+    """Yield consecutive slices of items holding at most size elements."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _fingerprint(database_id: str, story_data: Dict[str, Any]) -> str:
+    """Return a stable hash identifying a story submission to a database."""
+    canonical = json.dumps(
+        [database_id, story_data], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> float:
+    """Return a numeric response header such as Retry-After, or 0 if absent."""
+    try:
+        return float(headers.get(name, 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class _NotionLimiter:
+    """Adaptive concurrency limit for Notion API calls.
+
+    Uses additive-increase/multiplicative-decrease: the limit grows by alpha
+    while recent latency stays under target and is cut by beta whenever
+    Notion answers with 429 or a 5xx error. Rate-limit headers on responses
+    pause every caller until the quota has had time to recover, and a sliding
+    window keeps the request rate under Notion's average of 3 per second.
+    """
+
+    def __init__(
+        self,
+        c_start: float = 4.0,
+        c_min: float = 1.0,
+        c_max: float = 32.0,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        target_latency: float = 1.5,
+        window: int = 32,
+        min_remaining: int = 2,
+        min_fraction: float = 0.1,
+        default_pause: float = 1.0,
+        rate: int = 3,
+        period: float = 1.0,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            c_start: Initial number of concurrent calls allowed
+            c_min: Lowest the limit may drop to
+            c_max: Highest the limit may grow to
+            alpha: Amount added to the limit after a fast success
+            beta: Factor applied to the limit after a 429 or 5xx
+            target_latency: Average latency (seconds) considered healthy
+            window: Number of recent latencies averaged
+            min_remaining: Pause when x-ratelimit-remaining drops to this
+            min_fraction: Pause when remaining/limit drops below this
+            default_pause: Seconds to pause when no Retry-After is given
+            rate: Requests allowed per sliding window
+            period: Length of the sliding window in seconds
+        """
+        self.limit = c_start
+        self.c_min = c_min
+        self.c_max = c_max
+        self.alpha = alpha
+        self.beta = beta
+        self.target_latency = target_latency
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self.min_remaining = min_remaining
+        self.min_fraction = min_fraction
+        self.default_pause = default_pause
+        self.rate = rate
+        self.period = period
+        self._pause_until = 0.0
+        self._sent: Deque[float] = deque()
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    def _try_acquire(self) -> bool:
+        """Take a slot if one is free. Caller must hold the condition."""
+        if self._in_flight < int(self.limit):
+            self._in_flight += 1
+            return True
+        return False
+
+    def _release(self) -> None:
+        """Give a slot back and wake up waiting callers."""
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def _reserve(self) -> float:
+        """
+        Claim a place in the sliding window. Caller must hold the condition.
+
+        Returns:
+            0 if the request may be sent now, else seconds until a place frees up
+        """
+        now = time.monotonic()
+        sent = self._sent
+        while sent and now - sent[0] >= self.period:
+            sent.popleft()
+        if len(sent) < self.rate:
+            sent.append(now)
+            return 0.0
+        return self.period - (now - sent[0])
+
+    def _pause_left(self) -> float:
+        """Seconds until the current rate-limit pause ends."""
+        return self._pause_until - time.monotonic()
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """
+        Pause callers when Notion reports that its quota is nearly spent.
+
+        Args:
+            headers: Headers of any Notion response
+        """
+        retry_after = _header_number(headers, "retry-after")
+        remaining = _header_number(headers, "x-ratelimit-remaining")
+        quota = _header_number(headers, "x-ratelimit-limit")
+
+        low = "x-ratelimit-remaining" in headers and (
+            remaining <= self.min_remaining
+            or (quota > 0 and remaining / quota < self.min_fraction)
+        )
+        if retry_after or low:
+            pause = retry_after or self.default_pause
+            with self._cond:
+                self._pause_until = max(self._pause_until, time.monotonic() + pause)
+
+    @contextlib.contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one of the available concurrency slots (blocking)."""
+        delay = self._pause_left()
+        while delay > 0:
+            time.sleep(delay)
+            delay = self._pause_left()
+        with self._cond:
+            while not self._try_acquire():
+                self._cond.wait()
+        try:
+            while True:
+                with self._cond:
+                    delay = self._reserve()
+                if delay <= 0:
+                    break
+                time.sleep(delay)
+            yield
+        finally:
+            self._release()
+
+    @contextlib.asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        """Hold one of the available concurrency slots (async)."""
+        delay = self._pause_left()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self._pause_left()
+        while True:
+            with self._cond:
+                if self._try_acquire():
+                    break
+            await asyncio.sleep(0.05)
+        try:
+            while True:
+                with self._cond:
+                    delay = self._reserve()
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+            yield
+        finally:
+            self._release()
+
+    def record(self, latency: float, status: Optional[int] = None) -> None:
+        """
+        Adjust the limit after a call.
+
+        Args:
+            latency: Seconds the call took
+            status: HTTP status of a failed call, None on success
+        """
+        with self._cond:
+            if status is not None and (status == 429 or status >= 500):
+                self.limit = max(self.c_min, self.limit * self.beta)
+            elif status is None:
+                self._latencies.append(latency)
+                average = sum(self._latencies) / len(self._latencies)
+                if average <= self.target_latency:
+                    self.limit = min(self.c_max, self.limit + self.alpha)
+            self._cond.notify_all()
+
+
+# Statuses worth another attempt: rate limiting and gateway/server hiccups
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_backoff = wait_exponential_jitter(initial=0.5, max=10)
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Return True for Notion failures that may succeed when retried."""
+    if isinstance(error, HTTPResponseError):
+        return error.status in _RETRY_STATUSES
+    return isinstance(error, (httpx.TransportError, RequestTimeoutError))
+
+
+def _is_rate_limited(error: BaseException) -> bool:
+    """Return True for a 429, which Notion rejects without applying the request."""
+    return isinstance(error, HTTPResponseError) and error.status == 429
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Wait as long as Retry-After asks, else back off exponentially with jitter."""
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(error, HTTPResponseError):
+        delay = _header_number(error.headers, "retry-after")
+        if delay > 0:
+            return delay
+    return _backoff(retry_state)
+
+
+def _retry_on(predicate: Callable[[BaseException], bool]) -> Any:
+    """Build a retry decorator for the Notion errors matching predicate."""
+    return retry(
+        retry=retry_if_exception(predicate),
+        wait=_retry_wait,
+        stop=stop_after_attempt(5),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
+    )
+
+
+# Reads, updates and archives can be repeated safely. Creates and appends may
+# already have been applied when a 5xx or timeout comes back, so they are only
+# retried on 429.
+_retry_transient = _retry_on(_is_transient)
+_retry_rate_limited = _retry_on(_is_rate_limited)
+
+
+def _observe_response(response: httpx.Response) -> None:
+    """Feed a Notion response's rate-limit headers to the shared limiter."""
+    NotionStoryManager._limiter.observe(response.headers)
+
+
+async def _observe_async_response(response: httpx.Response) -> None:
+    """Async event hook version of _observe_response."""
+    NotionStoryManager._limiter.observe(response.headers)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_notion_clients() -> Tuple[str, Client]:
+    """
+    Read NOTION_TOKEN and build the sync SDK client once per process.
+
+    Returns:
+        Tuple of (token, sync client)
+    """
+    token = os.getenv("NOTION_TOKEN")
+    if not token:
+        raise ValueError("NOTION_TOKEN environment variable is required")
+
+    http_client = get_http_client("notion")
+    http_client.event_hooks["response"].append(_observe_response)
+    return token, Client(auth=token, client=http_client)
+
+
+def _get_async_notion_client(token: str) -> AsyncClient:
+    """
+    Return the async SDK client for the running event loop.
+
+    Args:
+        token: Notion integration token
+
+    Returns:
+        AsyncClient whose connections belong to the running loop
+    """
+
+    def create() -> AsyncClient:
+        http_client = get_async_http_client("notion")
+        http_client.event_hooks["response"].append(_observe_async_response)
+        return AsyncClient(auth=token, client=http_client)
+
+    return loop_local(("notion", token), create)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_database_id() -> str:
+    """
+    Return NOTION_DATABASE_ID from the environment, read once it is set.
+
+    A missing value raises instead of being cached, so managers created after
+    load_dotenv() still find it.
+    """
+    database_id = os.getenv("NOTION_DATABASE_ID")
+    if not database_id:
+        raise ValueError(
+            "NOTION_DATABASE_ID environment variable or parameter is required"
+        )
+    return database_id
 
 
 class NotionStoryManager:
     """Manages story data storage in Notion database."""
 
+    __slots__ = (
+        "notion_token",
+        "client",
+        "database_id",
+    )
+
+    # Notion rate limits apply per integration, so all managers share one
+    _limiter = _NotionLimiter()
+
+    # Pages created recently, keyed by a fingerprint of their database and
+    # story data. Shared so duplicates are caught across manager instances.
+    _page_fp_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+
+    # Recent database queries keyed by (database_id, limit, version), shared
+    # so a write through any manager is seen by all of them. Writes bump the
+    # database's version, so reads still in flight cannot repopulate the
+    # cache with results from before the write.
+    _query_cache: TTLCache = TTLCache(maxsize=128, ttl=60)
+    _db_versions: Dict[str, int] = {}
+    _cache_lock = threading.Lock()
+
     def __init__(self, database_id: Optional[str] = None):
         """
         Initialize Notion client.
@@ -19,31 +499,225 @@ class NotionStoryManager:
         Args:
             database_id: Notion database ID. If not provided, will try to get from env.
         """
-        self.notion_token = os.getenv("NOTION_TOKEN")
-        if not self.notion_token:
-            raise ValueError("NOTION_TOKEN environment variable is required")
+        # Clients are shared by every manager in the process
+        self.notion_token, self.client = _get_notion_clients()
+        self.database_id = database_id or _default_database_id()
 
-        self.client = Client(auth=self.notion_token)
-        self.database_id = database_id or os.getenv("NOTION_DATABASE_ID")
-        if not self.database_id:
-            raise ValueError(
-                "NOTION_DATABASE_ID environment variable or parameter is required"
-            )
+    @property
+    def async_client(self) -> AsyncClient:
+        """AsyncClient bound to the running event loop (use from a coroutine)."""
+        return _get_async_notion_client(self.notion_token)
+
+    def _invoke(self, method: Callable[..., Any], **kwargs: Any) -> Any:
+        """
+        Call a Notion endpoint once within the adaptive concurrency limit.
+
+        Args:
+            method: Bound SDK endpoint method, e.g. self.client.pages.create
+            **kwargs: Arguments for the endpoint
+
+        Returns:
+            Endpoint response
+        """
+        with self._limiter.slot():
+            start = time.monotonic()
+            try:
+                response = method(**kwargs)
+            except HTTPResponseError as e:
+                self._limiter.record(time.monotonic() - start, e.status)
+                raise
+            self._limiter.record(time.monotonic() - start)
+            return response
+
+    @_retry_transient
+    def _call(self, method: Callable[..., Any], **kwargs: Any) -> Any:
+        """
+        Call an idempotent Notion endpoint, retrying transient failures.
+
+        Transient failures (429, 5xx, network errors) are retried up to five
+        times; the slot is released while waiting between attempts.
+
+        Args:
+            method: Bound SDK endpoint method, e.g. self.client.pages.update
+            **kwargs: Arguments for the endpoint
+
+        Returns:
+            Endpoint response
+        """
+        return self._invoke(method, **kwargs)
+
+    @_retry_rate_limited
+    def _write(self, method: Callable[..., Any], **kwargs: Any) -> Any:
+        """
+        Call a non-idempotent Notion endpoint, retrying only on 429.
+
+        Args:
+            method: Bound endpoint method that creates content
+            **kwargs: Arguments for the endpoint
+
+        Returns:
+            Endpoint response
+        """
+        return self._invoke(method, **kwargs)
 
-    def _truncate_text(self, text: str, max_length: int = 1900) -> str:
+    def _send(
+        self, http_method: str, path: str, body: Dict[str, Any]
+    ) -> Dict[str, Any]:
         """
-        Truncate text to fit Notion's character limit with ellipsis.
+        Send a JSON request on the SDK's connection, encoded with orjson.
+
+        Page bodies are the largest payloads sent, so they skip the stdlib json
+        encoding done by the SDK. Base URL and auth headers come from the SDK.
 
         Args:
-            text: Text to truncate
-            max_length: Maximum length (default 1900 to be safe)
+            http_method: HTTP method
+            path: Endpoint path relative to the API root, e.g. "pages"
+            body: Request body
 
         Returns:
-            Truncated text
+            Decoded response body
+        """
+        http = self.client.client
+        request = http.build_request(
+            http_method, path, content=orjson.dumps(body), headers=_JSON_HEADERS
+        )
+        try:
+            response = http.send(request)
+        except httpx.TimeoutException:
+            raise RequestTimeoutError()
+        return _parse_response(response)
+
+    async def _asend(
+        self, http_method: str, path: str, body: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Async version of _send on the AsyncClient's connection."""
+        http = self.async_client.client
+        request = http.build_request(
+            http_method, path, content=orjson.dumps(body), headers=_JSON_HEADERS
+        )
+        try:
+            response = await http.send(request)
+        except httpx.TimeoutException:
+            raise RequestTimeoutError()
+        return _parse_response(response)
+
+    async def _ainvoke(
+        self, method: Callable[..., Awaitable[Any]], **kwargs: Any
+    ) -> Any:
         """
-        if len(text) <= max_length:
-            return text
-        return text[: max_length - 3] + "..."
+        Async version of _invoke for AsyncClient endpoints.
+
+        Args:
+            method: Bound async SDK endpoint method
+            **kwargs: Arguments for the endpoint
+
+        Returns:
+            Endpoint response
+        """
+        async with self._limiter.aslot():
+            start = time.monotonic()
+            try:
+                response = await method(**kwargs)
+            except HTTPResponseError as e:
+                self._limiter.record(time.monotonic() - start, e.status)
+                raise
+            self._limiter.record(time.monotonic() - start)
+            return response
+
+    @_retry_transient
+    async def _acall(self, method: Callable[..., Awaitable[Any]], **kwargs: Any) -> Any:
+        """Async version of _call for idempotent AsyncClient endpoints."""
+        return await self._ainvoke(method, **kwargs)
+
+    @_retry_rate_limited
+    async def _awrite(
+        self, method: Callable[..., Awaitable[Any]], **kwargs: Any
+    ) -> Any:
+        """Async version of _write for non-idempotent endpoints."""
+        return await self._ainvoke(method, **kwargs)
+
+    def _invalidate_reads(self) -> None:
+        """Drop cached query results after a write to the database."""
+        database_id = str(self.database_id)
+        with self._cache_lock:
+            self._db_versions[database_id] = self._db_versions.get(database_id, 0) + 1
+            for key in [key for key in self._query_cache if key[0] == database_id]:
+                del self._query_cache[key]
+
+    @staticmethod
+    def _as_dict(response: Any) -> Dict[str, Any]:
+        """Return an SDK response as a dict; the sync client already gives one."""
+        if isinstance(response, dict):
+            return response
+        return getattr(response, "__dict__", None) or {"id": str(response)}
+
+    def _build_page(self, story_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the pages.create arguments for a story.
+
+        Args:
+            story_data: Dictionary containing story information
+
+        Returns:
+            Keyword arguments for pages.create (parent, properties, children)
+        """
+        # Prepare the page properties based on your database structure
+        properties = {
+            "Title": {
+                "title": [
+                    {
+                        "text": {
+                            "content": story_data.get("prompt", "Untitled Story")[:100]
+                        }
+                    }
+                ]
+            },
+            "Status": _STATUS_GENERATED,
+        }
+
+        # Add custom properties if they exist in your database
+        for key, prop in _RT_FIELDS:
+            if key in story_data:
+                properties[prop] = _rt(_truncate_text(story_data[key]))
+
+        # Store ideas in the page content instead of as a property
+        # since the database doesn't have an Ideas property yet
+
+        # Create page content blocks
+        children = [_HEADING_IDEAS]
+
+        # Add ideas if available
+        if "ideas" in story_data and story_data["ideas"]:
+            children.append(_paragraph(_truncate_text(story_data.get("ideas", ""))))
+
+        # Add complete story heading and content; long stories span several
+        # paragraphs instead of being cut off
+        children.append(_HEADING_STORY)
+        children.extend(_paragraph(p) for p in _split_text(story_data.get("story", "")))
+
+        return {
+            "parent": {"database_id": self.database_id},
+            "properties": properties,
+            "children": children,
+        }
+
+    def _discard_page(self, page_id: str) -> None:
+        """Archive a page whose content could not be written completely."""
+        logger.error("Story page %s is incomplete; archiving it", page_id)
+        try:
+            self._call(self.client.pages.update, page_id=page_id, archived=True)
+        except Exception:
+            logger.exception("Could not archive incomplete story page %s", page_id)
+
+    async def _adiscard_page(self, page_id: str) -> None:
+        """Async version of _discard_page."""
+        logger.error("Story page %s is incomplete; archiving it", page_id)
+        try:
+            await self._acall(
+                self.async_client.pages.update, page_id=page_id, archived=True
+            )
+        except Exception:
+            logger.exception("Could not archive incomplete story page %s", page_id)
 
     def create_story_page(self, story_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -56,157 +730,131 @@ class NotionStoryManager:
             Created page data
         """
         try:
-            # Prepare the page properties based on your database structure
-            properties = {
-                "Title": {
-                    "title": [
-                        {
-                            "text": {
-                                "content": story_data.get("prompt", "Untitled Story")[
-                                    :100
-                                ]
-                            }
-                        }
-                    ]
-                },
-                "Status": {"select": {"name": "Generated"}},
-            }
-
-            # Add custom properties if they exist in your database
-            if "setting" in story_data:
-                properties["Setting"] = {
-                    "rich_text": [
-                        {
-                            "text": {
-                                "content": self._truncate_text(story_data["setting"])
-                            }
-                        }
-                    ]
-                }
+            # Identical submissions return the page that was already created
+            fingerprint = _fingerprint(str(self.database_id), story_data)
+            with self._cache_lock:
+                existing = self._page_fp_cache.get(fingerprint)
+            if existing is not None:
+                return existing
 
-            if "characters" in story_data:
-                properties["Characters"] = {
-                    "rich_text": [
-                        {
-                            "text": {
-                                "content": self._truncate_text(story_data["characters"])
-                            }
-                        }
-                    ]
-                }
+            # Create the page with as many blocks as one request allows
+            page_args = self._build_page(story_data)
+            children = page_args["children"]
+            page_args["children"] = children[:_MAX_BLOCKS]
+            page = self._write(
+                self._send, http_method="POST", path="pages", body=page_args
+            )
 
-            if "conflict" in story_data:
-                properties["Conflict"] = {
-                    "rich_text": [
-                        {
-                            "text": {
-                                "content": self._truncate_text(story_data["conflict"])
-                            }
-                        }
-                    ]
-                }
+            # Append the remaining blocks in order, one request per chunk
+            try:
+                for chunk in _chunks(children[_MAX_BLOCKS:]):
+                    self._write(
+                        self._send,
+                        http_method="PATCH",
+                        path=f"blocks/{page['id']}/children",
+                        body={"children": chunk},
+                    )
+            except Exception:
+                self._discard_page(page["id"])
+                raise
+            self._invalidate_reads()
 
-            if "resolution" in story_data:
-                properties["Resolution"] = {
-                    "rich_text": [
-                        {
-                            "text": {
-                                "content": self._truncate_text(story_data["resolution"])
-                            }
-                        }
-                    ]
-                }
+            with self._cache_lock:
+                self._page_fp_cache[fingerprint] = page
+            return page
 
-            # Store ideas in the page content instead of as a property
-            # since the database doesn't have an Ideas property yet
-
-            # Create page content blocks
-            children = [
-                {
-                    "object": "block",
-                    "type": "heading_1",
-                    "heading_1": {
-                        "rich_text": [
-                            {"type": "text", "text": {"content": "Generated Ideas"}}
-                        ]
-                    },
-                }
-            ]
+        except APIResponseError as e:
+            logger.error("Notion API error: %s", e)
+            raise
+        except Exception:
+            logger.exception("Error creating story page")
+            raise
 
-            # Add ideas if available
-            if "ideas" in story_data and story_data["ideas"]:
-                children.append(
-                    {
-                        "object": "block",
-                        "type": "paragraph",
-                        "paragraph": {
-                            "rich_text": [
-                                {
-                                    "type": "text",
-                                    "text": {
-                                        "content": self._truncate_text(
-                                            story_data.get("ideas", "")
-                                        )
-                                    },
-                                }
-                            ]
-                        },
-                    }
-                )
+    async def create_story_page_async(
+        self, story_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Create a new story page in the Notion database without blocking.
 
-            # Add complete story heading and content
-            children.extend(
-                [
-                    {
-                        "object": "block",
-                        "type": "heading_1",
-                        "heading_1": {
-                            "rich_text": [
-                                {"type": "text", "text": {"content": "Complete Story"}}
-                            ]
-                        },
-                    },
-                    {
-                        "object": "block",
-                        "type": "paragraph",
-                        "paragraph": {
-                            "rich_text": [
-                                {
-                                    "type": "text",
-                                    "text": {
-                                        "content": self._truncate_text(
-                                            story_data.get("story", "")
-                                        )
-                                    },
-                                }
-                            ]
-                        },
-                    },
-                ]
-            )
+        Args:
+            story_data: Dictionary containing story information
 
-            # Create the page
-            response = self.client.pages.create(
-                parent={"database_id": self.database_id},
-                properties=properties,
-                children=children,
+        Returns:
+            Created page data
+        """
+        try:
+            # Identical submissions return the page that was already created
+            fingerprint = _fingerprint(str(self.database_id), story_data)
+            with self._cache_lock:
+                existing = self._page_fp_cache.get(fingerprint)
+            if existing is not None:
+                return existing
+
+            page_args = self._build_page(story_data)
+            children = page_args["children"]
+            page_args["children"] = children[:_MAX_BLOCKS]
+            page = await self._awrite(
+                self._asend, http_method="POST", path="pages", body=page_args
             )
 
-            # Convert response to dict if it's not already
-            if hasattr(response, "__dict__"):
-                return response.__dict__
-            elif isinstance(response, dict):
-                return response
-            else:
-                return {"id": str(response)}
+            # Appends must stay sequential so the blocks keep their order
+            try:
+                for chunk in _chunks(children[_MAX_BLOCKS:]):
+                    await self._awrite(
+                        self._asend,
+                        http_method="PATCH",
+                        path=f"blocks/{page['id']}/children",
+                        body={"children": chunk},
+                    )
+            except Exception:
+                await self._adiscard_page(page["id"])
+                raise
+            self._invalidate_reads()
+
+            with self._cache_lock:
+                self._page_fp_cache[fingerprint] = page
+            return page
 
         except APIResponseError as e:
-            print(f"Notion API error: {e}")
+            logger.error("Notion API error: %s", e)
             raise
-        except Exception as e:
-            print(f"Error creating story page: {e}")
+        except Exception:
+            logger.exception("Error creating story page")
             raise
 
+    async def create_story_pages_async(
+        self, stories: List[Dict[str, Any]], max_concurrency: int = 8
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        Create several story pages concurrently.
+
+        One failed story does not abort the others, so the pages that were
+        created are always reported.
+
+        Args:
+            stories: Story dictionaries to save
+            max_concurrency: Maximum number of requests in flight
+
+        Returns:
+            Created page data in the same order as stories; failed stories
+            appear as their exception
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def create_one(story_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.create_story_page_async(story_data)
+
+        # Identical stories in the batch share a single create, since none of
+        # them is in the fingerprint cache until its page exists
+        fingerprints = [_fingerprint(str(self.database_id), s) for s in stories]
+        unique = dict(zip(fingerprints, stories))
+        results = await asyncio.gather(
+            *(create_one(s) for s in unique.values()), return_exceptions=True
+        )
+        by_fingerprint = dict(zip(unique, results))
+        return [by_fingerprint[fingerprint] for fingerprint in fingerprints]
+
     def get_story_pages(self, limit: int = 10) -> Dict[str, Any]:
         """
         Retrieve story pages from the database.
@@ -220,23 +868,120 @@ class NotionStoryManager:
         try:
             if not self.database_id:
                 raise ValueError("Database ID is required")
-            response = self.client.databases.query(
-                database_id=self.database_id, page_size=limit
+
+            # Serve repeated reads from the short-lived cache
+            with self._cache_lock:
+                version = self._db_versions.get(self.database_id, 0)
+                cache_key = (self.database_id, limit, version)
+                cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            response = self._call(
+                self.client.databases.query,
+                database_id=self.database_id,
+                page_size=limit,
             )
 
-            # Convert response to dict if it's not already
-            if hasattr(response, "__dict__"):
-                return response.__dict__
-            elif isinstance(response, dict):
-                return response
-            else:
-                return {"results": []}
+            result = self._as_dict(response)
+
+            with self._cache_lock:
+                self._query_cache[cache_key] = result
+            return result
 
         except APIResponseError as e:
-            print(f"Notion API error: {e}")
+            logger.error("Notion API error: %s", e)
             raise
-        except Exception as e:
-            print(f"Error retrieving story pages: {e}")
+        except Exception:
+            logger.exception("Error retrieving story pages")
+            raise
+
+    def get_story_page(self, page_id: str) -> Dict[str, Any]:
+        """
+        Retrieve a single story page.
+
+        Args:
+            page_id: Notion page ID
+
+        Returns:
+            Page data
+        """
+        try:
+            return self._as_dict(
+                self._call(self.client.pages.retrieve, page_id=page_id)
+            )
+
+        except APIResponseError as e:
+            logger.error("Notion API error: %s", e)
+            raise
+        except Exception:
+            logger.exception("Error retrieving story page")
+            raise
+
+    def query_story_pages(self, **query_args: Any) -> Dict[str, Any]:
+        """
+        Query the story database with arbitrary filters, bypassing the cache.
+
+        Args:
+            **query_args: databases.query arguments such as filter, page_size
+                and start_cursor
+
+        Returns:
+            Database query response
+        """
+        try:
+            return self._as_dict(
+                self._call(
+                    self.client.databases.query,
+                    database_id=self.database_id,
+                    **query_args,
+                )
+            )
+
+        except APIResponseError as e:
+            logger.error("Notion API error: %s", e)
+            raise
+        except Exception:
+            logger.exception("Error querying story pages")
+            raise
+
+    def get_story_blocks(self, page_id: str) -> List[Dict[str, Any]]:
+        """
+        Retrieve every content block of a story page.
+
+        Long stories span more than one page of results, so this follows
+        next_cursor until Notion reports no more blocks.
+
+        Args:
+            page_id: Notion page ID
+
+        Returns:
+            Blocks in page order
+        """
+        try:
+            blocks: List[Dict[str, Any]] = []
+            cursor = None
+            while True:
+                query_args: Dict[str, Any] = {
+                    "block_id": page_id,
+                    "page_size": _MAX_BLOCKS,
+                }
+                if cursor:
+                    query_args["start_cursor"] = cursor
+                response = self._as_dict(
+                    self._call(self.client.blocks.children.list, **query_args)
+                )
+                blocks.extend(response.get("results", []))
+
+                cursor = response.get("next_cursor")
+                if not response.get("has_more") or not cursor:
+                    return blocks
+
+        except APIResponseError as e:
+            logger.error("Notion API error: %s", e)
+            raise
+        except Exception:
+            logger.exception("Error retrieving story blocks")
             raise
 
     def update_story_page(
@@ -253,7 +998,7 @@ class NotionStoryManager:
             Updated page data
         """
         try:
-            properties = {}
+            properties: Dict[str, Any] = {}
 
             # Update properties based on provided data
             if "prompt" in story_data:
@@ -261,41 +1006,25 @@ class NotionStoryManager:
                     "title": [{"text": {"content": story_data["prompt"][:100]}}]
                 }
 
-            if "setting" in story_data:
-                properties["Setting"] = {
-                    "rich_text": [{"text": {"content": story_data["setting"]}}]
-                }
-
-            if "characters" in story_data:
-                properties["Characters"] = {
-                    "rich_text": [{"text": {"content": story_data["characters"]}}]
-                }
-
-            if "conflict" in story_data:
-                properties["Conflict"] = {
-                    "rich_text": [{"text": {"content": story_data["conflict"]}}]
-                }
+            for key, prop in _RT_FIELDS:
+                if key in story_data:
+                    properties[prop] = _rt(story_data[key])
 
-            if "resolution" in story_data:
-                properties["Resolution"] = {
-                    "rich_text": [{"text": {"content": story_data["resolution"]}}]
-                }
+            if "status" in story_data:
+                properties["Status"] = {"select": {"name": story_data["status"]}}
 
-            response = self.client.pages.update(page_id=page_id, properties=properties)
+            response = self._call(
+                self.client.pages.update, page_id=page_id, properties=properties
+            )
+            self._invalidate_reads()
 
-            # Convert response to dict if it's not already
-            if hasattr(response, "__dict__"):
-                return response.__dict__
-            elif isinstance(response, dict):
-                return response
-            else:
-                return {"id": str(response)}
+            return self._as_dict(response)
 
         except APIResponseError as e:
-            print(f"Notion API error: {e}")
+            logger.error("Notion API error: %s", e)
             raise
-        except Exception as e:
-            print(f"Error updating story page: {e}")
+        except Exception:
+            logger.exception("Error updating story page")
             raise
 
     def delete_story_page(self, page_id: str) -> bool:
@@ -309,12 +1038,19 @@ class NotionStoryManager:
             True if successful
         """
         try:
-            self.client.pages.update(page_id=page_id, archived=True)
+            self._call(self.client.pages.update, page_id=page_id, archived=True)
+            self._invalidate_reads()
+
+            # Forget the archived page so the same story can be created again
+            with self._cache_lock:
+                for fingerprint, page in list(self._page_fp_cache.items()):
+                    if page.get("id") == page_id:
+                        del self._page_fp_cache[fingerprint]
             return True
 
         except APIResponseError as e:
-            print(f"Notion API error: {e}")
+            logger.error("Notion API error: %s", e)
             raise
-        except Exception as e:
-            print(f"Error deleting story page: {e}")
+        except Exception:
+            logger.exception("Error deleting story page")
             raise
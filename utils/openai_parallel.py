@@ -0,0 +1,124 @@
+"""
+Bounded-concurrency runner for OpenAI requests.
+Keeps fan-out under request/token rate limits and retries rate-limit errors.
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, List, Sequence
+
+from openai import RateLimitError
+
+from utils.http import loop_local
+
+
+class RateLimiter:
+    """Token-bucket limiter for requests per minute and tokens per minute."""
+
+    def __init__(self, rpm: int, tpm: int):
+        """
+        Initialize both buckets full.
+
+        Args:
+            rpm: Requests allowed per minute
+            tpm: Tokens allowed per minute
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Top up both buckets for the time elapsed since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    async def acquire(self, tokens: int) -> None:
+        """
+        Wait until one request and the given number of tokens are available.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+        """
+        tokens = min(tokens, self.tpm)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+                wait = max(
+                    (1 - self._requests) * 60 / self.rpm,
+                    (tokens - self._tokens) * 60 / self.tpm,
+                )
+                await asyncio.sleep(wait)
+
+
+def get_rate_limiter(rpm: int, tpm: int) -> RateLimiter:
+    """
+    Return the limiter shared by every run_many call with the same budget.
+
+    Limiters are kept per event loop because their asyncio.Lock is bound to
+    the loop it is first used on.
+
+    Args:
+        rpm: Requests allowed per minute
+        tpm: Tokens allowed per minute
+
+    Returns:
+        Shared RateLimiter for the running loop
+    """
+    return loop_local(("rate_limiter", rpm, tpm), lambda: RateLimiter(rpm=rpm, tpm=tpm))
+
+
+async def run_many(
+    factories: Sequence[Callable[[], Awaitable[Any]]],
+    est_tokens: int = 1000,
+    max_concurrent: int = 10,
+    tpm: int = 90000,
+    rpm: int = 3500,
+    max_attempts: int = 5,
+) -> List[Any]:
+    """
+    Run many OpenAI calls concurrently within rate limits.
+
+    Each factory is called to create a fresh coroutine, so a call that hits a
+    rate limit can be retried with exponential backoff. Factories should use
+    a client with SDK retries disabled (max_retries=0) so every attempt is
+    charged to the shared rate limiter.
+
+    Args:
+        factories: Callables that each start one request
+        est_tokens: Estimated tokens per request, charged against tpm
+        max_concurrent: Maximum number of requests in flight
+        tpm: Tokens per minute ceiling
+        rpm: Requests per minute ceiling
+        max_attempts: Attempts per request before giving up on rate limits
+
+    Returns:
+        Results in input order; failed requests appear as their exception
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    limiter = get_rate_limiter(rpm, tpm)
+
+    async def guarded(factory: Callable[[], Awaitable[Any]]) -> Any:
+        async with semaphore:
+            for attempt in range(1, max_attempts + 1):
+                await limiter.acquire(est_tokens)
+                try:
+                    return await factory()
+                except RateLimitError:
+                    if attempt == max_attempts:
+                        raise
+                    await asyncio.sleep(2 ** (attempt - 1) + random.random())
+
+    return await asyncio.gather(
+        *(guarded(factory) for factory in factories), return_exceptions=True
+    )
@@ -1,10 +1,10 @@
 STORY_PROMPT_TEMPLATE = "Write a story about {topic}."
 
-IDEA_GENERATOR_PROMPT_TEMPLATE = """
+# Static instructions for the idea generator. Kept in their own system message
+# so every request shares the same prefix and can hit provider-side caching.
+IDEA_GENERATOR_SYSTEM_PROMPT = """
 You are a creative and imaginative story idea generator. Your task is to generate original, compelling, and concise story ideas based on the user's input.
 
-User Input: {user_input}
-
 Please generate 3-5 unique story ideas that are:
 1. Original and imaginative - avoid clichés and predictable plots
 2. Concise - each idea should be 2-3 sentences maximum
@@ -18,4 +18,14 @@ Example:
 Be bold, creative, and surprising in your ideas!
 """
 
-print("Prompt templates loaded.")
+IDEA_GENERATOR_USER_PROMPT_TEMPLATE = "User Input: {user_input}"
+
+# Split once around the placeholder so rendering is a plain concatenation
+_IDEA_USER_PREFIX, _IDEA_USER_SUFFIX = IDEA_GENERATOR_USER_PROMPT_TEMPLATE.split(
+    "{user_input}"
+)
+
+
+def render_idea_user_prompt(user_input: str) -> str:
+    """Fill the idea generator user template with the user's input."""
+    return _IDEA_USER_PREFIX + user_input + _IDEA_USER_SUFFIX
@@ -0,0 +1,73 @@
+"""
+Exact-match cache for LLM responses.
+Stores responses in Redis when configured, otherwise in process memory.
+"""
+
+import hashlib
+import os
+from typing import Any, Optional
+
+from cachetools import TTLCache
+
+
+class ResponseCache:
+    """Key/value cache for LLM completions with a per-entry TTL."""
+
+    def __init__(
+        self, ttl: int = 3600, redis_url: Optional[str] = None, maxsize: int = 1024
+    ):
+        """
+        Initialize the cache backend.
+
+        Args:
+            ttl: Seconds an entry stays valid
+            redis_url: Redis connection URL. If not provided, will try to get
+                from env and fall back to an in-memory store.
+            maxsize: Most entries the in-memory store keeps before evicting
+        """
+        self.ttl = ttl
+        self._memory: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._redis: Any = None
+
+        redis_url = redis_url or os.getenv("IDEA_CACHE_REDIS_URL")
+        if redis_url:
+            import redis
+
+            self._redis = redis.Redis.from_url(redis_url, decode_responses=True)
+
+    @staticmethod
+    def make_key(model: str, temperature: float, max_tokens: int, prompt: str) -> str:
+        """
+        Build a cache key from everything that shapes the completion.
+
+        Args:
+            model: Model or deployment name
+            temperature: Sampling temperature
+            max_tokens: Completion token limit
+            prompt: Fully formatted prompt text
+
+        Returns:
+            Hex digest identifying the request
+        """
+        raw = f"{model}|{temperature}|{max_tokens}|{prompt}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None on a miss."""
+        if self._redis is not None:
+            return self._redis.get(key)
+
+        return self._memory.get(key)
+
+    def set(self, key: str, value: str) -> None:
+        """Store value under key for the configured TTL."""
+        if self._redis is not None:
+            self._redis.setex(key, self.ttl, value)
+            return
+
+        self._memory[key] = value
+
+
+def cache_enabled() -> bool:
+    """Return True when response caching is switched on via IDEA_CACHE=1."""
+    return os.getenv("IDEA_CACHE", "0") == "1"